@@ -10,18 +10,33 @@ The module uses the Meme API (https://github.com/D3vd/Meme_Api) to fetch memes.
 
 import os
 import random
+import itertools
 import tempfile
+import time
 import json
-import textwrap
 import platform
-from io import BytesIO
-import subprocess
+from collections import deque
+from functools import lru_cache
+from concurrent.futures import ThreadPoolExecutor, as_completed
+try:
+    import orjson
+except ImportError:  # optional faster JSON backend
+    orjson = None
 import certifi
 import requests
-from PIL import Image, ImageDraw, ImageFont
+import urllib3
+from requests.adapters import HTTPAdapter
+from PIL import Image
 
 HISTORY_FILE = os.path.join(os.path.dirname(__file__), "meme_history.json")
 SETTINGS_FILE = os.path.join(os.path.dirname(__file__), "settings.json")
+ETAGS_FILE = os.path.join(os.path.dirname(__file__), "meme_etags.json")
+RESOLUTION_CACHE_FILE = os.path.join(os.path.expanduser("~"), ".cache", "random_meme", "resolution")
+RESOLUTION_CACHE_TTL = 3600  # seconds
+LINE_SPACING = 4  # pixels between title lines
+SUPPORTED_IMAGE_EXTENSIONS = ('.jpg', '.jpeg', '.png', '.webp')
+UNSUPPORTED_CONTENT_TYPES = ('image/gif', 'video/')  # animated/video memes, not worth decoding
+SUPPORTED_IMAGE_FORMATS = ('JPEG', 'PNG', 'WEBP')
 
 DEFAULT_SETTINGS = {
     "font": {
@@ -30,6 +45,10 @@ DEFAULT_SETTINGS = {
     },
     "bottom_strip_height": 50,
     "max_history": 100,
+    "resize": {
+        "filter": "BICUBIC",
+        "reducing_gap": 3.0
+    },
     "subreddits": [
         None,
         "programmingmemes",
@@ -42,61 +61,225 @@ DEFAULT_SETTINGS = {
     ]
 }
 
+# Shared HTTP session so keep-alive reuses connections across API retries and image download
+_SESSION = requests.Session()
+_SESSION.mount('https://', HTTPAdapter(pool_connections=2, pool_maxsize=8, max_retries=0))
+_SESSION.verify = certifi.where()
+_SESSION.headers.update({
+    'Accept-Encoding': 'gzip, deflate',
+    'Connection': 'keep-alive',
+    'User-Agent': 'random_meme_wallpaper/1.0'
+})
+REQUEST_TIMEOUT = (3, 10)  # (connect, read) seconds
+IMAGE_TIMEOUT = (3, 30)
+FETCH_BATCH_SIZE = 4  # concurrent Meme API requests per batch
+
+def read_json(path):
+    """
+    Read JSON file, using orjson if available.
+
+    Args:
+        path (str): Path to the JSON file
+
+    Returns:
+        Parsed JSON content
+    """
+    if orjson is not None:
+        with open(path, 'rb') as f:
+            return orjson.loads(f.read())
+    with open(path, 'r') as f:
+        return json.load(f)
+
+def write_json(path, obj):
+    """
+    Write object to JSON file, using orjson if available.
+
+    Args:
+        path (str): Path to the JSON file
+        obj: JSON serializable object
+    """
+    if orjson is not None:
+        with open(path, 'wb') as f:
+            f.write(orjson.dumps(obj))
+        return
+    with open(path, 'w') as f:
+        json.dump(obj, f)
+
 def load_history():
     """
     Load history of previously shown memes from a JSON file.
 
     Returns:
-        list: List of meme URLs that have been previously shown
+        tuple: (deque of meme URLs in display order capped at MAX_HISTORY,
+                set of the same URLs for fast membership checks)
     """
+    shown_memes = []
     if os.path.exists(HISTORY_FILE):
-        with open(HISTORY_FILE, 'r') as f:
-            return json.load(f)['shown_memes']
-    return []
+        shown_memes = read_json(HISTORY_FILE)['shown_memes']
+    history = deque(shown_memes, maxlen=MAX_HISTORY)
+    return history, set(history)
 
 def save_history(history):
     """
     Save the history of shown memes to a JSON file.
 
     Args:
-        history (list): List of meme URLs to save
+        history (Iterable): Meme URLs to save, oldest first
+    """
+    write_json(HISTORY_FILE, {'shown_memes': list(history)})
+
+def load_etags():
+    """
+    Load ETags of previous Meme API responses from a JSON file.
+
+    Returns:
+        dict: Mapping of endpoint URL to its last ETag
+    """
+    try:
+        return read_json(ETAGS_FILE)
+    except (OSError, ValueError):
+        return {}
+
+def save_etags(etags):
+    """
+    Save ETags of Meme API responses to a JSON file.
+
+    Args:
+        etags (dict): Mapping of endpoint URL to its last ETag
+    """
+    try:
+        write_json(ETAGS_FILE, etags)
+    except OSError:
+        pass
+
+def get_meme_api_url(subreddit):
+    """
+    Get Meme API endpoint URL for given subreddit.
+
+    Args:
+        subreddit (str): Subreddit name (None means random)
+
+    Returns:
+        str: Endpoint URL
+    """
+    url = "https://meme-api.com/gimme"
+    if subreddit:
+        url += f"/{subreddit}"
+    return url
+
+def fetch_meme(subreddit, etag=None):
+    """
+    Fetch a single random meme from the Meme API.
+
+    Args:
+        subreddit (str): Subreddit name to fetch from (None means random)
+        etag (str): Last ETag of the endpoint, used for a conditional request (optional)
+
+    Returns:
+        tuple: (subreddit, meme_title, meme_url, etag) if successful, None if failed or unchanged
+    """
+    url = get_meme_api_url(subreddit)
+    headers = {}
+    if etag:
+        headers['If-None-Match'] = etag
+    try:
+        response = _SESSION.get(url, headers=headers, timeout=REQUEST_TIMEOUT)
+        if response.status_code == 304:
+            # Same meme as last time, no body to parse
+            return None
+        if response.status_code == 200:
+            data = response.json()
+            return subreddit, data.get("title"), data.get("url"), response.headers.get('ETag')
+    except (requests.RequestException, ValueError):
+        # Transport errors and non-JSON bodies (e.g. HTML error pages) just skip this attempt
+        return None
+    return None
+
+def is_supported_image(url):
+    """
+    Check whether URL points to a still image format that can be used as wallpaper.
+
+    Args:
+        url (str): URL of the meme
+
+    Returns:
+        bool: True for JPEG, PNG and WebP images, False otherwise (e.g. GIF or video)
     """
-    with open(HISTORY_FILE, 'w') as f:
-        json.dump({'shown_memes': history}, f)
+    return bool(url) and url.lower().endswith(SUPPORTED_IMAGE_EXTENSIONS)
 
 def get_random_meme(subreddits: list):
     """
     Fetch a random meme from specified subreddits using the Meme API.
 
+    Requests are issued in concurrent batches and the first meme not yet in history wins.
+
     Args:
         subreddits (list): List of subreddit names to fetch from (None means random)
 
     Returns:
         tuple: (meme_title, meme_url) if successful, None if failed
     """
-    history = load_history()
+    history, history_set = load_history()
+    etags = load_etags()
     max_attempts = 25
 
-    for _ in range(max_attempts):
-        index = random.randint(0, len(subreddits) - 1)
-        subreddit = subreddits[index]
-        print(f"Selected subreddit: {subreddit if subreddit else 'Default'}")
-        url = "https://meme-api.com/gimme"
-        if subreddit:
-            url += f"/{subreddit}"
-        response = requests.get(url, verify=certifi.where())
-        if response.status_code == 200:
-            data = response.json()
-            meme_url = data.get("url")
-            meme_title = data.get("title")
-            if meme_url not in history:
-                history.append(meme_url)
-                if len(history) > MAX_HISTORY:
-                    history = history[-MAX_HISTORY:]
-                save_history(history)
-                return meme_title, meme_url
+    # Try every subreddit once (in random order) before repeating any of them
+    order = random.sample(subreddits, len(subreddits))
+    attempts = itertools.islice(itertools.cycle(order), max_attempts)
+
+    executor = ThreadPoolExecutor(max_workers=FETCH_BATCH_SIZE)
+    try:
+        while True:
+            batch = list(itertools.islice(attempts, FETCH_BATCH_SIZE))
+            if not batch:
+                break
+            futures = [executor.submit(fetch_meme, subreddit, etags.get(get_meme_api_url(subreddit)))
+                       for subreddit in batch]
+            for future in as_completed(futures):
+                result = future.result()
+                if result is None:
+                    continue
+                subreddit, meme_title, meme_url, etag = result
+                if etag:
+                    etags[get_meme_api_url(subreddit)] = etag
+                if not is_supported_image(meme_url):
+                    continue
+                if meme_url not in history_set:
+                    # Requests already in flight cannot be stopped, their results
+                    # (including new ETags) are ignored
+                    for pending in futures:
+                        pending.cancel()
+                    print(f"Selected subreddit: {subreddit if subreddit else 'Default'}")
+                    if history and len(history) == history.maxlen:
+                        history_set.discard(history[0])
+                    history.append(meme_url)
+                    history_set.add(meme_url)
+                    save_history(history)
+                    return meme_title, meme_url
+    finally:
+        executor.shutdown(wait=False)
+        save_etags(etags)
     return None, None
 
+def flatten_settings(settings, prefix=''):
+    """
+    Flatten nested settings dictionary into dot notation keys.
+
+    Args:
+        settings (dict): Possibly nested settings dictionary
+        prefix (str): Key prefix used for recursion
+
+    Returns:
+        dict: Mapping of dotted keys (e.g., 'font.size') to values, including intermediate dicts
+    """
+    flat = {}
+    for k, v in settings.items():
+        key = f"{prefix}{k}"
+        flat[key] = v
+        if isinstance(v, dict):
+            flat.update(flatten_settings(v, f"{key}."))
+    return flat
+
 def get_setting(key, default=None):
     """
     Get setting value using dot notation with fallback to default.
@@ -108,13 +291,9 @@ def get_setting(key, default=None):
     Returns:
         The setting value or default/DEFAULT_SETTINGS value if not found
     """
-    try:
-        value = SETTINGS
-        for k in key.split('.'):
-            value = value[k]
-        return value
-    except (KeyError, TypeError):
-        return default if default is not None else DEFAULT_SETTINGS.get(key)
+    if key in _SETTINGS_FLAT:
+        return _SETTINGS_FLAT[key]
+    return default if default is not None else _DEFAULT_SETTINGS_FLAT.get(key)
 
 def load_settings():
     """
@@ -124,154 +303,294 @@ def load_settings():
         dict: Dictionary containing user settings or default settings
     """
     try:
-        with open(SETTINGS_FILE, 'r') as f:
-            return json.load(f)
+        return read_json(SETTINGS_FILE)
     except FileNotFoundError:
         return DEFAULT_SETTINGS
 
 SETTINGS = load_settings()
+# Resolve dotted keys once so get_setting is a single dict lookup
+_SETTINGS_FLAT = flatten_settings(SETTINGS)
+_DEFAULT_SETTINGS_FLAT = flatten_settings(DEFAULT_SETTINGS)
 MAX_HISTORY = get_setting('max_history')
 
-def add_title_to_image(image, title):
+@lru_cache(maxsize=4)
+def get_font(name, size):
     """
-    Add title text above the image and black strip below.
+    Load TrueType font, cached so repeated renders skip parsing the font file.
 
     Args:
-        image (PIL.Image): Source image
-        title (str): Text to add above the image
+        name (str): Font file name or path
+        size (int): Font size
 
     Returns:
-        PIL.Image: New image with added title and bottom strip
+        PIL.ImageFont: Requested font, or default font if not available
     """
-    # Try to use configured font, fallback to default if not available
-    try:
-        font = ImageFont.truetype(
-            get_setting('font.name'),
-            get_setting('font.size')
-        )
-    except:
-        font = ImageFont.load_default()
+    from PIL import ImageFont
 
-    # Wrap text to fit image width
-    margin = 20
-    max_width = image.width - 2 * margin
-    wrapped_text = textwrap.fill(title, width=int(max_width/20))
-
-    # Calculate text height
-    dummy_draw = ImageDraw.Draw(image)
-    text_bbox = dummy_draw.textbbox((0, 0), wrapped_text, font=font)
-    text_height = text_bbox[3] - text_bbox[1] + 2 * margin
+    try:
+        return ImageFont.truetype(name, size)
+    except OSError:
+        return ImageFont.load_default()
 
-    # Add bottom strip height from settings
-    bottom_strip_height = get_setting('bottom_strip_height')
+def wrap_to_width(text, font, max_width):
+    """
+    Greedily wrap text into lines whose rendered width fits the given pixel width.
 
-    # Create new image with space for title and bottom strip
-    new_img = Image.new('RGB',
-                        (image.width, image.height + text_height + bottom_strip_height),
-                        (0, 0, 0))
+    Args:
+        text (str): Text to wrap
+        font (PIL.ImageFont): Font used to measure the text
+        max_width (int): Maximum line width in pixels
 
-    # Add original image in the middle
-    new_img.paste(image, (0, text_height))
+    Returns:
+        list: Wrapped lines (words wider than max_width are broken between characters)
+    """
+    lines = []
+    line = ''
+    for word in text.split():
+        candidate = f"{line} {word}" if line else word
+        if font.getlength(candidate) <= max_width:
+            line = candidate
+            continue
+        if line:
+            lines.append(line)
+        # Break words that do not fit on a line of their own
+        line = ''
+        for char in word:
+            if line and font.getlength(line + char) > max_width:
+                lines.append(line)
+                line = char
+            else:
+                line += char
+    if line:
+        lines.append(line)
+    return lines
+
+def load_cached_resolution():
+    """
+    Load screen resolution cached by a previous run if it is still fresh.
 
-    # Add title text
-    draw = ImageDraw.Draw(new_img)
-    draw.text((margin, margin), wrapped_text, font=font, fill='white')
+    Returns:
+        tuple: (width, height) from the cache file, None if missing or expired
+    """
+    try:
+        if time.time() - os.path.getmtime(RESOLUTION_CACHE_FILE) > RESOLUTION_CACHE_TTL:
+            return None
+        with open(RESOLUTION_CACHE_FILE, 'r') as f:
+            width, height = f.read().strip().split('x')
+            return int(width), int(height)
+    except (OSError, ValueError):
+        return None
+
+def save_cached_resolution(resolution):
+    """
+    Save screen resolution to the cache file for subsequent runs.
 
-    return new_img
+    Args:
+        resolution (tuple): (width, height) of the primary screen
+    """
+    try:
+        os.makedirs(os.path.dirname(RESOLUTION_CACHE_FILE), exist_ok=True)
+        with open(RESOLUTION_CACHE_FILE, 'w') as f:
+            f.write(f"{resolution[0]}x{resolution[1]}")
+    except OSError:
+        pass
 
+@lru_cache(maxsize=1)
 def get_screen_resolution():
     """
-    Get primary screen resolution in an OS-independent way.
+    Get primary screen resolution, using the cached value from a recent run if available.
+
+    The result is memoized for the lifetime of the process.
 
     Returns:
         tuple: (width, height) of the primary screen, defaults to (1920, 1080)
     """
+    resolution = load_cached_resolution()
+    if resolution is None:
+        resolution = detect_screen_resolution()
+        if resolution is None:
+            return 1920, 1080  # fallback resolution
+        save_cached_resolution(resolution)
+    return resolution
+
+def detect_screen_resolution():
+    """
+    Detect primary screen resolution in an OS-independent way.
+
+    Returns:
+        tuple: (width, height) of the primary screen, None if detection failed
+    """
+    system = platform.system()
+
     try:
-        if platform.system() == 'Windows':
+        if system == 'Windows':
             import ctypes
             user32 = ctypes.windll.user32
             return user32.GetSystemMetrics(0), user32.GetSystemMetrics(1)
-        elif platform.system() == 'Linux':
-            output = subprocess.Popen(r'xrandr | grep "\*" | cut -d" " -f4',
-                                      shell=True, stdout=subprocess.PIPE).communicate()[0]
-            resolution = output.split()[0].split(b'x')
-            return int(resolution[0]), int(resolution[1])
-        elif platform.system() == 'Darwin':  # macOS
-            output = subprocess.check_output(['system_profiler', 'SPDisplaysDataType'])
-            res = [l for l in output.decode().split('\n') if 'Resolution' in l][0]
-            return map(int, res.split(':')[1].strip().split(' x '))
+        elif system == 'Linux':
+            import subprocess
+            output = subprocess.run(['xrandr', '--current'],
+                                    stdout=subprocess.PIPE, check=True).stdout
+            # Current mode is marked with '*', e.g. "   1920x1080     60.00*+"
+            for line in output.splitlines():
+                if b'*' in line:
+                    width, height = line.split()[0].split(b'x')
+                    return int(width), int(height)
+        elif system == 'Darwin':  # macOS
+            import plistlib
+            import subprocess
+            output = subprocess.run(['system_profiler', '-xml', 'SPDisplaysDataType'],
+                                    stdout=subprocess.PIPE, check=True).stdout
+            for gpu in plistlib.loads(output)[0]['_items']:
+                for display in gpu.get('spdisplays_ndrvs', []):
+                    # e.g. "2560 x 1440 @ 60.00Hz" or "2560 x 1440 Retina"
+                    res = display.get('_spdisplays_pixels') or display.get('_spdisplays_resolution')
+                    if res:
+                        width, height = res.split(' x ')
+                        return int(width), int(height.split()[0])
     except:
-        return 1920, 1080  # fallback resolution
+        return None
 
-def resize_image(image, target_width, target_height):
+def scale_to_fit(image, max_width, max_height):
     """
-    Resize image to fit screen by adding black bars if needed.
+    Resize image to fit into given box while maintaining aspect ratio.
 
     Args:
-        image (PIL.Image): Image to resize
-        target_width (int): Target width in pixels
-        target_height (int): Target height in pixels
+        image (PIL.Image): Image to resize (enormous images are shrunk in place first)
+        max_width (int): Maximum width in pixels
+        max_height (int): Maximum height in pixels
 
     Returns:
-        PIL.Image: Resized image that fits the screen with black bars if needed
+        PIL.Image: Resized image
     """
     # Calculate ratios
     original_ratio = image.width / image.height
-    target_ratio = target_width / target_height
+    target_ratio = max_width / max_height
 
     if target_ratio > original_ratio:
-        # Screen is wider than image - fit to height
-        new_height = target_height
-        new_width = int(target_height * original_ratio)
+        # Box is wider than image - fit to height
+        new_height = max_height
+        new_width = max(1, int(max_height * original_ratio))
     else:
-        # Screen is taller than image - fit to width
-        new_width = target_width
-        new_height = int(target_width / original_ratio)
+        # Box is taller than image - fit to width
+        new_width = max_width
+        new_height = max(1, int(max_width / original_ratio))
 
-    # Resize image while maintaining aspect ratio
-    resized_image = image.resize((new_width, new_height), Image.Resampling.LANCZOS)
+    # Cheaply shrink enormous sources close to target size first
+    if image.width > new_width * 3 and image.height > new_height * 3:
+        image.thumbnail((new_width * 3, new_height * 3), Image.Resampling.BILINEAR)
 
-    # Create black background of target size
-    final_image = Image.new('RGB', (target_width, target_height), (0, 0, 0))
+    resample = getattr(Image.Resampling, str(get_setting('resize.filter')).upper(),
+                       Image.Resampling.BICUBIC)
+    return image.resize((new_width, new_height), resample,
+                        reducing_gap=get_setting('resize.reducing_gap'))
 
-    # Calculate position to center the image
-    x = (target_width - new_width) // 2
-    y = (target_height - new_height) // 2
+def compose_wallpaper(image, title, screen_width, screen_height):
+    """
+    Compose screen-sized wallpaper with title above the image and black strip below.
+
+    The image is resized once straight into its final place on a single canvas, with
+    black bars filling the rest of the screen.
+
+    Args:
+        image (PIL.Image): Source image
+        title (str): Text to add above the image (no title and strip if empty)
+        screen_width (int): Screen width in pixels
+        screen_height (int): Screen height in pixels
+
+    Returns:
+        PIL.Image: Final wallpaper of screen size
+    """
+    from PIL import ImageDraw
 
-    # Paste resized image onto black background
-    final_image.paste(resized_image, (x, y))
+    margin = 20
+    lines = []
+    text_height = bottom_strip_height = 0
+    if title:
+        font = get_font(get_setting('font.name'), get_setting('font.size'))
+        lines = wrap_to_width(title, font, screen_width - 2 * margin)
+    if lines:
+        # Calculate text height the same way ImageDraw lays out multiline text
+        line_spacing = font.getbbox('A')[3] + LINE_SPACING
+        text_top = font.getbbox(lines[0])[1]
+        text_bottom = (len(lines) - 1) * line_spacing + font.getbbox(lines[-1])[3]
+        text_height = text_bottom - text_top + 2 * margin
+        bottom_strip_height = get_setting('bottom_strip_height')
+
+    # Resize image into the space left between title and bottom strip
+    image_height = max(1, screen_height - text_height - bottom_strip_height)
+    resized_image = scale_to_fit(image, screen_width, image_height)
+
+    # Center title, image and bottom strip block on a black screen-sized canvas
+    final_image = Image.new('RGB', (screen_width, screen_height), (0, 0, 0))
+    top = max(0, (screen_height - text_height - resized_image.height - bottom_strip_height) // 2)
+    final_image.paste(resized_image, ((screen_width - resized_image.width) // 2, top + text_height))
+
+    if lines:
+        text_width = max(font.getlength(line) for line in lines)
+        draw = ImageDraw.Draw(final_image)
+        draw.multiline_text((max(margin, (screen_width - text_width) // 2), top + margin), '\n'.join(lines),
+                            font=font, fill='white', spacing=LINE_SPACING, align='center')
 
     return final_image
 
-def download_image(url, title):
+def download_image(url, title, resolution=None):
     """
     Download image from URL and prepare it as wallpaper.
 
     Args:
         url (str): URL of the image to download
         title (str): Title text to add to the image
+        resolution (tuple): (width, height) of the screen, detected if not given
 
     Returns:
         str: Path to the saved wallpaper image or None if failed
     """
-    response = requests.get(url, verify=certifi.where())
-    if response.status_code == 200:
-        # Open image from bytes
-        image = Image.open(BytesIO(response.content))
+    try:
+        response = _SESSION.get(url, stream=True, timeout=IMAGE_TIMEOUT)
+    except requests.RequestException:
+        return None
+    content_type = response.headers.get('Content-Type', '').split(';')[0].strip().lower()
+    if response.status_code == 200 and not content_type.startswith(UNSUPPORTED_CONTENT_TYPES):
+        # Decode image from the response stream (Pillow buffers non-seekable streams itself)
+        response.raw.decode_content = True
+        with response:
+            try:
+                image = Image.open(response.raw)
+                if image.format not in SUPPORTED_IMAGE_FORMATS:
+                    return None
+                image.load()
+            except (requests.RequestException, urllib3.exceptions.HTTPError, OSError):
+                # Read timeouts and dropped connections surface while reading the body
+                return None
 
         # Convert to RGB if necessary (for PNG images)
         if image.mode != 'RGB':
             image = image.convert('RGB')
 
-        # Add title to image
-        image = add_title_to_image(image, title)
-
-        # Save the modified image
-        file_path = os.path.join(tempfile.gettempdir(), "random_meme_wallpaper.jpg")
-        image.save(file_path, "JPEG", quality=95)
-        return file_path
+        return save_wallpaper(image, title, resolution)
+    response.close()
     return None
 
+def save_wallpaper(image, title=None, resolution=None):
+    """
+    Compose screen-sized wallpaper from image and save it as the wallpaper file.
+
+    Args:
+        image (PIL.Image): Source image in RGB mode
+        title (str): Title text to add to the image (optional)
+        resolution (tuple): (width, height) of the screen, detected if not given
+
+    Returns:
+        str: Path to the saved wallpaper image
+    """
+    screen_width, screen_height = resolution or get_screen_resolution()
+    image = compose_wallpaper(image, title, screen_width, screen_height)
+    file_path = os.path.join(tempfile.gettempdir(), "random_meme_wallpaper.jpg")
+    # 4:2:0 chroma subsampling is indistinguishable at wallpaper viewing distance
+    image.save(file_path, "JPEG", quality=88, subsampling=2)
+    return file_path
+
 def set_wallpaper(image_path):
     """
     Set wallpaper in an OS-independent way.
@@ -279,18 +598,11 @@ def set_wallpaper(image_path):
     Supports Windows, macOS, and Linux (GNOME, KDE, XFCE).
 
     Args:
-        image_path (str): Path to the image file to use as wallpaper
+        image_path (str): Path to the screen-sized image file to use as wallpaper
 
     Returns:
         bool: True if successful, False otherwise
     """
-    # Adjust image to screen size
-    image = Image.open(image_path)
-    screen_width, screen_height = get_screen_resolution()
-    image = resize_image(image, screen_width, screen_height)
-    image_path = os.path.join(tempfile.gettempdir(), "random_meme_wallpaper.jpg")
-    image.save(image_path, "JPEG", quality=95)
-
     system = platform.system()
 
     try:
@@ -299,6 +611,7 @@ def set_wallpaper(image_path):
             ctypes.windll.user32.SystemParametersInfoW(20, 0, image_path, 3)
 
         elif system == 'Darwin':  # macOS
+            import subprocess
             script = f'''
                 tell application "Finder"
                 set desktop picture to POSIX file "{image_path}"
@@ -307,6 +620,8 @@ def set_wallpaper(image_path):
             subprocess.run(['osascript', '-e', script])
 
         elif system == 'Linux':
+            import subprocess
+
             # Try common Linux desktop environments
             desktop = os.environ.get('XDG_CURRENT_DESKTOP', '').lower()
 
@@ -338,11 +653,17 @@ def set_wallpaper(image_path):
         return False
 
 if __name__ == "__main__":
-    meme_title, meme_url = get_random_meme(get_setting('subreddits'))
-    if meme_url:
-        img_path = download_image(meme_url, meme_title)
-    else:
-        img_path = os.path.join(os.path.dirname(__file__), "fallback_balrog.jpg")
+    # Probe screen resolution in the background while the meme is being fetched
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        resolution_future = executor.submit(get_screen_resolution)
+        meme_title, meme_url = get_random_meme(get_setting('subreddits'))
+        img_path = None
+        if meme_url:
+            img_path = download_image(meme_url, meme_title, resolution_future.result())
+        if not img_path:
+            fallback_path = os.path.join(os.path.dirname(__file__), "fallback_balrog.jpg")
+            img_path = save_wallpaper(Image.open(fallback_path).convert('RGB'),
+                                      resolution=resolution_future.result())
     if img_path and set_wallpaper(img_path):
         print(f"Wallpaper updated! ({img_path})")
     else: